@@ -7,13 +7,16 @@ Generates regulatory compliance checklists based on the applicable regulation
 from __future__ import annotations
 
 import argparse
+import functools
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
 
-@dataclass
+
+@dataclass(slots=True)
 class ChecklistItem:
     id: str
     requirement: str
@@ -64,18 +67,22 @@ class ComplianceChecklist:
             "",
         ]
 
-        current_priority = None
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        for item in sorted(self.items, key=lambda x: priority_order[x.priority]):
-            if item.priority != current_priority:
-                current_priority = item.priority
-                lines.extend([f"## {current_priority.upper()} Priority", ""])
-
-            checkbox = "x" if item.completed else " "
-            lines.append(f"- [{checkbox}] **{item.id}**: {item.requirement}")
-            lines.append(f"  - {item.description}")
-            lines.append(f"  - *Reference: {item.article}*")
-            lines.append("")
+        # There are only four priorities, so one O(N) bucketing pass replaces
+        # the O(N log N) sort and the header state machine.
+        buckets: dict[str, list[ChecklistItem]] = {p: [] for p in PRIORITY_ORDER}
+        for item in self.items:
+            buckets[item.priority].append(item)
+
+        for priority, bucket in buckets.items():
+            if not bucket:
+                continue
+            lines.extend([f"## {priority.upper()} Priority", ""])
+            for item in bucket:
+                checkbox = "x" if item.completed else " "
+                lines.append(f"- [{checkbox}] **{item.id}**: {item.requirement}")
+                lines.append(f"  - {item.description}")
+                lines.append(f"  - *Reference: {item.article}*")
+                lines.append("")
 
         return "\n".join(lines)
 
@@ -91,7 +98,7 @@ class ComplianceChecklist:
 
 
 # Regulation-specific requirements
-EU_AI_ACT_HIGH_RISK = [
+EU_AI_ACT_HIGH_RISK = (
     ChecklistItem(
         id="EU-HR-01",
         requirement="Risk Management System",
@@ -188,9 +195,9 @@ EU_AI_ACT_HIGH_RISK = [
         article="Article 62",
         priority="high",
     ),
-]
+)
 
-EU_AI_ACT_LIMITED = [
+EU_AI_ACT_LIMITED = (
     ChecklistItem(
         id="EU-LR-01",
         requirement="AI Interaction Transparency",
@@ -223,9 +230,9 @@ EU_AI_ACT_LIMITED = [
         article="General",
         priority="medium",
     ),
-]
+)
 
-NIST_AI_RMF_REQUIREMENTS = [
+NIST_AI_RMF_REQUIREMENTS = (
     ChecklistItem(
         id="NIST-GOV-01",
         requirement="AI Governance Structure",
@@ -290,9 +297,9 @@ NIST_AI_RMF_REQUIREMENTS = [
         article="MANAGE 4.1",
         priority="medium",
     ),
-]
+)
 
-ISO_42001_REQUIREMENTS = [
+ISO_42001_REQUIREMENTS = (
     ChecklistItem(
         id="ISO-01",
         requirement="AI Policy",
@@ -341,7 +348,7 @@ ISO_42001_REQUIREMENTS = [
         article="Clause 9.2",
         priority="medium",
     ),
-]
+)
 
 REGULATION_MAP = {
     "eu_ai_act": {"high": EU_AI_ACT_HIGH_RISK, "limited": EU_AI_ACT_LIMITED},
@@ -350,6 +357,31 @@ REGULATION_MAP = {
 }
 
 
+@functools.lru_cache(maxsize=64)
+def _resolve_template_items(regulation: str, risk_level: str) -> tuple[ChecklistItem, ...]:
+    """Resolve the immutable template tuple for a regulation/risk level pair.
+
+    Memoized: the fallback logic runs once per pair, and repeated
+    generate_checklist calls (the common web-API pattern) hit the cache.
+    Callers must copy the items before mutating them.
+    """
+    if regulation not in REGULATION_MAP:
+        available = ", ".join(REGULATION_MAP.keys())
+        raise ValueError(f"Unknown regulation: {regulation}. Available: {available}")
+
+    reg_items = REGULATION_MAP[regulation]
+    if risk_level in reg_items:
+        return reg_items[risk_level]
+    if "all" in reg_items:
+        return reg_items["all"]
+
+    # Fall back to the highest risk level available
+    for level in ("high", "limited", "minimal"):
+        if level in reg_items:
+            return reg_items[level]
+    return ()
+
+
 class ComplianceChecker:
     """Generate compliance checklists based on regulation and risk level."""
 
@@ -363,24 +395,9 @@ class ComplianceChecker:
         system_type: str = "general",
     ) -> ComplianceChecklist:
         """Generate a compliance checklist for the given regulation and risk level."""
-        if regulation not in REGULATION_MAP:
-            available = ", ".join(REGULATION_MAP.keys())
-            raise ValueError(f"Unknown regulation: {regulation}. Available: {available}")
-
-        reg_items = REGULATION_MAP[regulation]
-
-        # Get items for the specific risk level or all items
-        items: list[ChecklistItem] = []
-        if risk_level in reg_items:
-            items = [self._copy_item(i) for i in reg_items[risk_level]]
-        elif "all" in reg_items:
-            items = [self._copy_item(i) for i in reg_items["all"]]
-        else:
-            # Fall back to the highest risk level available
-            for level in ["high", "limited", "minimal"]:
-                if level in reg_items:
-                    items = [self._copy_item(i) for i in reg_items[level]]
-                    break
+        # Items are copied per call because callers mark them completed;
+        # only the template resolution is cached.
+        items = [self._copy_item(i) for i in _resolve_template_items(regulation, risk_level)]
 
         return ComplianceChecklist(
             regulation=regulation,
@@ -410,30 +427,40 @@ class ComplianceChecker:
 
     def check_compliance(self, checklist: ComplianceChecklist) -> dict[str, Any]:
         """Analyze compliance status of a checklist."""
+        # Single pass: the naive property-based version walks the item list
+        # five times, which adds up on large combined checklists.
         total = len(checklist.items)
-        completed = sum(1 for i in checklist.items if i.completed)
-        critical_total = len(checklist.critical_items)
-        critical_done = sum(1 for i in checklist.critical_items if i.completed)
+        completed = 0
+        critical_total = 0
+        critical_done = 0
+        pending_items: list[str] = []
+        pending_critical: list[str] = []
+
+        for item in checklist.items:
+            is_critical = item.priority == "critical"
+            critical_total += is_critical
+            if item.completed:
+                completed += 1
+                critical_done += is_critical
+            else:
+                pending_items.append(item.id)
+                if is_critical:
+                    pending_critical.append(item.id)
+
+        completion_rate = completed / total * 100 if total else 0.0
 
         return {
-            "overall_completion": f"{completed}/{total} ({checklist.completion_rate:.0f}%)",
+            "overall_completion": f"{completed}/{total} ({completion_rate:.0f}%)",
             "critical_completion": f"{critical_done}/{critical_total}",
             "is_compliant": completed == total,
             "critical_compliant": critical_done == critical_total,
-            "pending_items": [i.id for i in checklist.items if not i.completed],
-            "pending_critical": [i.id for i in checklist.critical_items if not i.completed],
+            "pending_items": pending_items,
+            "pending_critical": pending_critical,
         }
 
     @staticmethod
     def _copy_item(item: ChecklistItem) -> ChecklistItem:
-        return ChecklistItem(
-            id=item.id,
-            requirement=item.requirement,
-            description=item.description,
-            regulation=item.regulation,
-            article=item.article,
-            priority=item.priority,
-        )
+        return replace(item, completed=False, notes="")
 
     @staticmethod
     def available_regulations() -> list[str]:
@@ -6,14 +6,20 @@ including data sensitivity, autonomy level, affected population, and domain.
 
 from __future__ import annotations
 
-import argparse
+import functools
+import io
 import json
+import sys
+import warnings
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import yaml
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed extra
+    orjson = None
 
 
 class RiskLevel(str, Enum):
@@ -23,7 +29,7 @@ class RiskLevel(str, Enum):
     MINIMAL = "minimal"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskDimension:
     name: str
     score: float  # 0-100
@@ -31,7 +37,11 @@ class RiskDimension:
     description: str
 
 
-@dataclass
+# Bound str.format skips re-parsing the format spec on every table row.
+_DIM_ROW_TMPL = "| {n} | {s:.0f}/100 | {w:.0%} | {desc} |".format
+
+
+@dataclass(slots=True)
 class RiskAssessmentResult:
     system_name: str
     risk_level: RiskLevel
@@ -42,45 +52,45 @@ class RiskAssessmentResult:
     eu_ai_act_category: str
     metadata: dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
+    def to_dict(self, *, include_dimensions: bool = True) -> dict[str, Any]:
+        """Serialize the result; ``include_dimensions=False`` skips the
+        per-dimension dicts for callers that only emit the top-level fields."""
+        out: dict[str, Any] = {
             "system_name": self.system_name,
             "risk_level": self.risk_level.value,
             "risk_score": round(self.risk_score, 1),
-            "dimensions": [
+        }
+        if include_dimensions:
+            out["dimensions"] = [
                 {"name": d.name, "score": d.score, "weight": d.weight, "description": d.description}
                 for d in self.dimensions
-            ],
-            "key_risks": self.key_risks,
-            "recommended_mitigations": self.recommended_mitigations,
-            "eu_ai_act_category": self.eu_ai_act_category,
-        }
+            ]
+        out["key_risks"] = self.key_risks
+        out["recommended_mitigations"] = self.recommended_mitigations
+        out["eu_ai_act_category"] = self.eu_ai_act_category
+        return out
 
     def to_markdown(self) -> str:
-        lines = [
-            f"# Risk Assessment: {self.system_name}",
-            "",
-            f"**Risk Level:** {self.risk_level.value.upper()}",
-            f"**Risk Score:** {self.risk_score:.1f}/100",
-            f"**EU AI Act Category:** {self.eu_ai_act_category}",
-            "",
-            "## Risk Dimensions",
-            "",
-            "| Dimension | Score | Weight | Description |",
-            "|-----------|-------|--------|-------------|",
-        ]
-        for d in self.dimensions:
-            lines.append(f"| {d.name} | {d.score:.0f}/100 | {d.weight:.0%} | {d.description} |")
-
-        lines.extend(["", "## Key Risks", ""])
-        for risk in self.key_risks:
-            lines.append(f"- {risk}")
-
-        lines.extend(["", "## Recommended Mitigations", ""])
-        for m in self.recommended_mitigations:
-            lines.append(f"- {m}")
-
-        return "\n".join(lines)
+        # Write into one growable StringIO buffer instead of accumulating a
+        # list of lines and joining at the end.
+        buf = io.StringIO()
+        write = buf.write
+        write(f"# Risk Assessment: {self.system_name}\n\n")
+        write(f"**Risk Level:** {self.risk_level.value.upper()}\n")
+        write(f"**Risk Score:** {self.risk_score:.1f}/100\n")
+        write(f"**EU AI Act Category:** {self.eu_ai_act_category}\n\n")
+        write("## Risk Dimensions\n\n")
+        write("| Dimension | Score | Weight | Description |\n")
+        write("|-----------|-------|--------|-------------|\n")
+        write("\n".join(
+            _DIM_ROW_TMPL(n=d.name, s=d.score, w=d.weight, desc=d.description)
+            for d in self.dimensions
+        ))
+        write("\n\n## Key Risks\n\n")
+        write("\n".join(f"- {risk}" for risk in self.key_risks))
+        write("\n\n## Recommended Mitigations\n\n")
+        write("\n".join(f"- {m}" for m in self.recommended_mitigations))
+        return buf.getvalue()
 
 
 # EU AI Act prohibited domains and high-risk categories
@@ -102,6 +112,11 @@ HIGH_RISK_DOMAINS = {
     "biometric_identification": "Biometric categorization",
 }
 
+# Frozen membership sets for the hot path; the dicts above stay the source
+# of the human-readable descriptions.
+_PROHIBITED_DOMAIN_SET = frozenset(PROHIBITED_DOMAINS)
+_HIGH_RISK_DOMAIN_SET = frozenset(HIGH_RISK_DOMAINS)
+
 DOMAIN_RISK_SCORES = {
     "social_scoring": 100,
     "real_time_biometric_public": 100,
@@ -123,6 +138,37 @@ DOMAIN_RISK_SCORES = {
     "research": 25,
 }
 
+# Interned keys let lookups hit the dict's pointer-equality fast path when
+# assess() interns the incoming strings before using them.
+DOMAIN_RISK_SCORES = {sys.intern(k): v for k, v in DOMAIN_RISK_SCORES.items()}
+
+
+def _build_domain_table() -> dict[str, tuple[int, str, str, bool, bool]]:
+    """Fold the static domain taxonomy into one lookup table.
+
+    Each entry is ``(score, description, category_label, is_prohibited,
+    is_high_risk)``; ``category_label`` is empty when the EU AI Act category
+    depends on the computed risk level rather than the domain alone.
+    """
+    table: dict[str, tuple[int, str, str, bool, bool]] = {}
+    for domain, score in DOMAIN_RISK_SCORES.items():
+        if domain in _PROHIBITED_DOMAIN_SET:
+            table[domain] = (
+                score, PROHIBITED_DOMAINS[domain],
+                "Article 5 — Prohibited AI Practices", True, False,
+            )
+        elif domain in _HIGH_RISK_DOMAIN_SET:
+            table[domain] = (
+                score, HIGH_RISK_DOMAINS[domain],
+                "Annex III — High-Risk AI Systems", False, True,
+            )
+        else:
+            table[domain] = (score, f"Domain: {domain}", "", False, False)
+    return table
+
+
+_DOMAIN_TABLE = _build_domain_table()
+
 AUTONOMY_SCORES = {
     "fully_autonomous": 90,
     "semi_autonomous": 60,
@@ -130,6 +176,7 @@ AUTONOMY_SCORES = {
     "human_on_the_loop": 50,
     "advisory_only": 20,
 }
+AUTONOMY_SCORES = {sys.intern(k): v for k, v in AUTONOMY_SCORES.items()}
 
 POPULATION_SCORES = {
     "individual": 15,
@@ -138,6 +185,81 @@ POPULATION_SCORES = {
     "large": 75,
     "public": 90,
 }
+POPULATION_SCORES = {sys.intern(k): v for k, v in POPULATION_SCORES.items()}
+
+# Dimension descriptions depend only on the key, so build them once instead
+# of re-running the f-string on every assessment.
+_AUTONOMY_DESCRIPTIONS = {
+    k: f"System autonomy: {k.replace('_', ' ')}" for k in AUTONOMY_SCORES
+}
+_POPULATION_DESCRIPTIONS = {k: f"Population size: {k}" for k in POPULATION_SCORES}
+
+# Data sensitivity score indexed by uses_personal_data * 2 + uses_biometric_data:
+# base 20, +35 for personal data, +30 for biometric data (all below the 100 cap).
+_DATA_SCORE_LUT = (20, 50, 55, 85)
+
+# Mitigation templates are immutable; extending a result list from a shared
+# tuple is a memcpy instead of rebuilding the same list literal per call.
+_UNACCEPTABLE_MITIGATIONS = (
+    "STOP: This AI application is prohibited under the EU AI Act",
+    "Consult legal counsel before any further development",
+)
+
+_HIGH_RISK_MITIGATIONS = (
+    "Implement conformity assessment procedures (Article 43)",
+    "Establish quality management system (Article 17)",
+    "Maintain technical documentation (Article 11)",
+    "Implement human oversight measures (Article 14)",
+    "Register system in EU database (Article 60)",
+    "Conduct fundamental rights impact assessment",
+)
+
+_LIMITED_RISK_MITIGATIONS = (
+    "Implement transparency obligations — inform users of AI interaction",
+    "Document system capabilities and limitations",
+    "Establish monitoring procedures for output quality",
+)
+
+_NO_RISKS_IDENTIFIED = "No significant risks identified at this time"
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_load():
+    """Resolve ``yaml.load`` on first use, preferring the libyaml loader.
+
+    PyYAML costs tens of milliseconds to import; deferring it means library
+    consumers that only ever call :meth:`RiskAssessor.assess` never pay for
+    it at all.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as _Loader
+    except ImportError:  # pragma: no cover - depends on how pyyaml was built
+        from yaml import SafeLoader as _Loader
+
+        warnings.warn("libyaml C extension not available; YAML parsing will be ~5x slower")
+    return functools.partial(yaml.load, Loader=_Loader)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML config, memoized on (path, mtime).
+
+    YAML parsing dominates repeated CLI invocations and batch assessments
+    that reuse the same config; keying on the file's mtime means an edited
+    file is re-parsed while an unchanged one is served from the cache.
+    Callers must not mutate the returned dict.
+    """
+    # Feed the parser the open binary handle: libyaml streams straight from
+    # it, skipping the read-to-string copy and the decode/rescan pass.
+    with Path(path).open("rb") as f:
+        return _yaml_load()(f) or {}
+
+
+def _load_yaml(config_path: str | Path) -> dict[str, Any]:
+    path = Path(config_path)
+    return _load_yaml_cached(str(path), path.stat().st_mtime_ns)
 
 
 class RiskAssessor:
@@ -146,8 +268,9 @@ class RiskAssessor:
     def __init__(self, config_path: str | Path | None = None):
         self.config: dict[str, Any] = {}
         if config_path:
-            path = Path(config_path)
-            self.config = yaml.safe_load(path.read_text()) or {}
+            # Copy at the boundary: config is a public, per-instance dict and
+            # must not alias the cached parse in _load_yaml_cached.
+            self.config = dict(_load_yaml(config_path))
 
     def assess(
         self,
@@ -161,8 +284,20 @@ class RiskAssessor:
         description: str = "",
     ) -> RiskAssessmentResult:
         """Run a full risk assessment on an AI system."""
+        domain = sys.intern(domain)
+        autonomy_level = sys.intern(autonomy_level)
+        affected_population_size = sys.intern(affected_population_size)
+
+        # One table lookup replaces the repeated domain categorization the
+        # helpers used to perform independently.
+        info = _DOMAIN_TABLE.get(domain)
+        if info is None:
+            info = (40, f"Domain: {domain}", "", False, False)
+        domain_score, domain_description, category_label, is_prohibited, is_high_risk_domain = info
+
         dimensions = self._calculate_dimensions(
-            domain=domain,
+            domain_score=domain_score,
+            domain_description=domain_description,
             uses_personal_data=uses_personal_data,
             uses_biometric_data=uses_biometric_data,
             is_safety_critical=is_safety_critical,
@@ -170,14 +305,18 @@ class RiskAssessor:
             affected_population_size=affected_population_size,
         )
 
-        weighted_score = sum(d.score * d.weight for d in dimensions)
-        total_weight = sum(d.weight for d in dimensions)
-        risk_score = weighted_score / total_weight if total_weight > 0 else 0
+        # The dimension weights are fixed constants that sum to 1.0, so the
+        # weighted mean is one fused pass with no normalizing second sum.
+        risk_score = sum(d.score * d.weight for d in dimensions)
 
-        risk_level = self._determine_risk_level(risk_score, domain)
-        eu_category = self._determine_eu_category(domain, risk_level)
-        key_risks = self._identify_key_risks(dimensions, domain, uses_personal_data)
-        mitigations = self._recommend_mitigations(risk_level, key_risks, domain)
+        risk_level = self._determine_risk_level(risk_score, is_prohibited, is_high_risk_domain)
+        eu_category = self._determine_eu_category(risk_level, category_label)
+        key_risks = self._identify_key_risks(
+            dimensions, domain_description, uses_personal_data, is_prohibited, is_high_risk_domain
+        )
+        mitigations = self._recommend_mitigations(
+            risk_level, uses_personal_data, is_high_risk_domain
+        )
 
         return RiskAssessmentResult(
             system_name=system_name,
@@ -190,9 +329,101 @@ class RiskAssessor:
             metadata={"domain": domain, "description": description},
         )
 
+    def assess_batch(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Score many systems at once with vectorized NumPy arithmetic.
+
+        Each record takes the same keys as :meth:`assess`. Returns one dict
+        per record with ``system_name``, ``risk_score``, ``risk_level``, and
+        ``eu_ai_act_category`` — the per-record dimension objects and
+        mitigation text that ``assess`` builds are exactly the overhead this
+        path exists to skip. Requires numpy (the ``speed`` extra).
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:  # pragma: no cover
+            raise ImportError(
+                "assess_batch requires numpy; install the 'speed' extra"
+            ) from exc
+
+        n = len(records)
+        if n == 0:
+            return []
+
+        infos = [
+            _DOMAIN_TABLE.get(r["domain"]) or (40, "", "", False, False) for r in records
+        ]
+        domain_scores = np.fromiter((i[0] for i in infos), np.float64, count=n)
+        autonomy_scores = np.array(
+            [AUTONOMY_SCORES.get(r.get("autonomy_level", "human_in_the_loop"), 50)
+             for r in records],
+            dtype=np.float64,
+        )
+        pop_scores = np.array(
+            [POPULATION_SCORES.get(r.get("affected_population_size", "small"), 50)
+             for r in records],
+            dtype=np.float64,
+        )
+        personal = np.fromiter(
+            (bool(r.get("uses_personal_data")) for r in records), np.bool_, count=n
+        )
+        biometric = np.fromiter(
+            (bool(r.get("uses_biometric_data")) for r in records), np.bool_, count=n
+        )
+        safety = np.fromiter(
+            (bool(r.get("is_safety_critical")) for r in records), np.bool_, count=n
+        )
+        prohibited = np.fromiter((i[3] for i in infos), np.bool_, count=n)
+        high_domain = np.fromiter((i[4] for i in infos), np.bool_, count=n)
+
+        # Data sensitivity: 20 + 35*personal + 30*biometric, capped at 100.
+        data_scores = np.multiply(personal, 35.0)
+        data_scores += np.multiply(biometric, 30.0)
+        data_scores += 20.0
+        np.minimum(data_scores, 100.0, out=data_scores)
+        safety_scores = np.where(safety, 85.0, 20.0)
+
+        # Same weights as _calculate_dimensions, applied to all rows at once.
+        # Every array here is owned by this function, so the weighted sum is
+        # accumulated in place rather than allocating a temporary per term.
+        domain_scores *= 0.25
+        data_scores *= 0.20
+        autonomy_scores *= 0.20
+        pop_scores *= 0.15
+        safety_scores *= 0.20
+        scores = domain_scores
+        scores += data_scores
+        scores += autonomy_scores
+        scores += pop_scores
+        scores += safety_scores
+
+        # Mirrors _determine_risk_level across the whole batch, branchlessly:
+        # searchsorted buckets the scores at the 35/65 thresholds, then the
+        # domain flags override via masked assignment. Levels stay uint8
+        # codes until output time.
+        codes = np.array((3, 2, 1), dtype=np.uint8)[
+            np.searchsorted((35.0, 65.0), scores, side="right")
+        ]
+        codes[high_domain] = 1
+        codes[prohibited] = 0
+
+        level_by_code = (
+            RiskLevel.UNACCEPTABLE, RiskLevel.HIGH, RiskLevel.LIMITED, RiskLevel.MINIMAL
+        )
+        results = []
+        for record, info, score, code in zip(records, infos, scores, codes):
+            level = level_by_code[code]
+            results.append({
+                "system_name": record.get("system_name", ""),
+                "risk_score": round(float(score), 1),
+                "risk_level": level.value,
+                "eu_ai_act_category": self._determine_eu_category(level, info[2]),
+            })
+        return results
+
     def _calculate_dimensions(
         self,
-        domain: str,
+        domain_score: int,
+        domain_description: str,
         uses_personal_data: bool,
         uses_biometric_data: bool,
         is_safety_critical: bool,
@@ -202,28 +433,21 @@ class RiskAssessor:
         dimensions = []
 
         # Domain risk
-        domain_score = DOMAIN_RISK_SCORES.get(domain, 40)
         dimensions.append(
             RiskDimension(
                 name="Domain Sensitivity",
                 score=domain_score,
                 weight=0.25,
-                description=HIGH_RISK_DOMAINS.get(
-                    domain, PROHIBITED_DOMAINS.get(domain, f"Domain: {domain}")
-                ),
+                description=domain_description,
             )
         )
 
         # Data sensitivity
-        data_score = 20
-        if uses_personal_data:
-            data_score += 35
-        if uses_biometric_data:
-            data_score += 30
+        data_score = _DATA_SCORE_LUT[uses_personal_data * 2 + uses_biometric_data]
         dimensions.append(
             RiskDimension(
                 name="Data Sensitivity",
-                score=min(data_score, 100),
+                score=data_score,
                 weight=0.20,
                 description="Assessment of data types processed by the system",
             )
@@ -231,23 +455,31 @@ class RiskAssessor:
 
         # Autonomy level
         autonomy_score = AUTONOMY_SCORES.get(autonomy_level, 50)
+        autonomy_desc = (
+            _AUTONOMY_DESCRIPTIONS.get(autonomy_level)
+            or f"System autonomy: {autonomy_level.replace('_', ' ')}"
+        )
         dimensions.append(
             RiskDimension(
                 name="Autonomy Level",
                 score=autonomy_score,
                 weight=0.20,
-                description=f"System autonomy: {autonomy_level.replace('_', ' ')}",
+                description=autonomy_desc,
             )
         )
 
         # Affected population
         pop_score = POPULATION_SCORES.get(affected_population_size, 50)
+        pop_desc = (
+            _POPULATION_DESCRIPTIONS.get(affected_population_size)
+            or f"Population size: {affected_population_size}"
+        )
         dimensions.append(
             RiskDimension(
                 name="Affected Population",
                 score=pop_score,
                 weight=0.15,
-                description=f"Population size: {affected_population_size}",
+                description=pop_desc,
             )
         )
 
@@ -266,26 +498,33 @@ class RiskAssessor:
 
         return dimensions
 
-    def _determine_risk_level(self, score: float, domain: str) -> RiskLevel:
-        if domain in PROHIBITED_DOMAINS:
+    def _determine_risk_level(
+        self, score: float, is_prohibited: bool, is_high_risk_domain: bool
+    ) -> RiskLevel:
+        if is_prohibited:
             return RiskLevel.UNACCEPTABLE
-        if score >= 65 or domain in HIGH_RISK_DOMAINS:
+        if score >= 65 or is_high_risk_domain:
             return RiskLevel.HIGH
         if score >= 35:
             return RiskLevel.LIMITED
         return RiskLevel.MINIMAL
 
-    def _determine_eu_category(self, domain: str, risk_level: RiskLevel) -> str:
-        if domain in PROHIBITED_DOMAINS:
-            return "Article 5 — Prohibited AI Practices"
-        if risk_level == RiskLevel.HIGH or domain in HIGH_RISK_DOMAINS:
+    def _determine_eu_category(self, risk_level: RiskLevel, category_label: str) -> str:
+        if category_label:
+            return category_label
+        if risk_level == RiskLevel.HIGH:
             return "Annex III — High-Risk AI Systems"
         if risk_level == RiskLevel.LIMITED:
             return "Article 52 — Transparency Obligations"
         return "Minimal Risk — No specific obligations"
 
     def _identify_key_risks(
-        self, dimensions: list[RiskDimension], domain: str, uses_personal_data: bool
+        self,
+        dimensions: list[RiskDimension],
+        domain_description: str,
+        uses_personal_data: bool,
+        is_prohibited: bool,
+        is_high_risk_domain: bool,
     ) -> list[str]:
         risks = []
         for dim in dimensions:
@@ -294,45 +533,33 @@ class RiskAssessor:
 
         if uses_personal_data:
             risks.append("GDPR compliance requirements due to personal data processing")
-        if domain in HIGH_RISK_DOMAINS:
-            risks.append(f"EU AI Act high-risk classification: {HIGH_RISK_DOMAINS[domain]}")
-        if domain in PROHIBITED_DOMAINS:
-            risks.append(f"PROHIBITED under EU AI Act: {PROHIBITED_DOMAINS[domain]}")
+        if is_high_risk_domain:
+            risks.append(f"EU AI Act high-risk classification: {domain_description}")
+        if is_prohibited:
+            risks.append(f"PROHIBITED under EU AI Act: {domain_description}")
 
-        return risks or ["No significant risks identified at this time"]
+        return risks or [_NO_RISKS_IDENTIFIED]
 
     def _recommend_mitigations(
-        self, risk_level: RiskLevel, key_risks: list[str], domain: str
+        self, risk_level: RiskLevel, uses_personal_data: bool, is_high_risk_domain: bool
     ) -> list[str]:
-        mitigations = []
+        mitigations: list[str] = []
 
         if risk_level == RiskLevel.UNACCEPTABLE:
-            mitigations.append("STOP: This AI application is prohibited under the EU AI Act")
-            mitigations.append("Consult legal counsel before any further development")
+            mitigations.extend(_UNACCEPTABLE_MITIGATIONS)
             return mitigations
 
         if risk_level == RiskLevel.HIGH:
-            mitigations.extend([
-                "Implement conformity assessment procedures (Article 43)",
-                "Establish quality management system (Article 17)",
-                "Maintain technical documentation (Article 11)",
-                "Implement human oversight measures (Article 14)",
-                "Register system in EU database (Article 60)",
-                "Conduct fundamental rights impact assessment",
-            ])
+            mitigations.extend(_HIGH_RISK_MITIGATIONS)
 
         if risk_level == RiskLevel.LIMITED:
-            mitigations.extend([
-                "Implement transparency obligations — inform users of AI interaction",
-                "Document system capabilities and limitations",
-                "Establish monitoring procedures for output quality",
-            ])
+            mitigations.extend(_LIMITED_RISK_MITIGATIONS)
 
-        if any("personal data" in r.lower() for r in key_risks):
+        if uses_personal_data:
             mitigations.append("Conduct Data Protection Impact Assessment (DPIA)")
             mitigations.append("Ensure GDPR Article 22 compliance for automated decisions")
 
-        if domain in HIGH_RISK_DOMAINS:
+        if is_high_risk_domain:
             mitigations.append("Implement bias testing and fairness monitoring")
             mitigations.append("Establish regular audit schedule")
 
@@ -340,12 +567,12 @@ class RiskAssessor:
 
     def assess_from_yaml(self, config_path: str | Path) -> RiskAssessmentResult:
         """Run risk assessment from a YAML configuration file."""
-        path = Path(config_path)
-        config = yaml.safe_load(path.read_text())
-        return self.assess(**config)
+        return self.assess(**_load_yaml(config_path))
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="AI Risk Assessment Engine")
     parser.add_argument("--name", required=True, help="AI system name")
     parser.add_argument("--domain", required=True, help="Application domain")
@@ -371,7 +598,11 @@ def main():
     )
 
     if args.output == "json":
-        print(json.dumps(result.to_dict(), indent=2))
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2))
+            sys.stdout.buffer.write(b"\n")
+        else:
+            print(json.dumps(result.to_dict(), indent=2))
     else:
         print(result.to_markdown())
 
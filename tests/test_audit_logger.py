@@ -88,6 +88,25 @@ class TestAuditLogger:
         e2 = self.logger.log_event("risk_assessment", "System A", "user1")
         assert e1.checksum != e2.checksum
 
+    def test_log_events_bulk(self):
+        events = self.logger.log_events_bulk([
+            {"event_type": "risk_assessment", "system_name": "System A", "actor": "user1"},
+            {"event_type": "compliance_check", "system_name": "System B", "actor": "user2",
+             "details": {"passed": True}},
+        ])
+        assert len(events) == 2
+        assert events[0].id < events[1].id
+
+        result = self.logger.verify_integrity()
+        assert result["valid"] is True
+        assert result["total_events"] == 2
+
+    def test_log_events_bulk_invalid_type_raises(self):
+        with pytest.raises(ValueError, match="Invalid event type"):
+            self.logger.log_events_bulk([
+                {"event_type": "bogus", "system_name": "S", "actor": "a"},
+            ])
+
     def test_details_stored_correctly(self):
         details = {"score": 85, "level": "high", "tags": ["critical"]}
         self.logger.log_event("risk_assessment", "System", "user", details=details)
@@ -83,6 +83,30 @@ class TestRiskAssessor:
         assert "Risk Level" in md
         assert "Key Risks" in md
 
+    def test_assess_batch_matches_scalar_path(self):
+        records = [
+            {"system_name": "Resume Screener", "domain": "employment",
+             "uses_personal_data": True, "autonomy_level": "semi_autonomous",
+             "affected_population_size": "large"},
+            {"system_name": "Code Review Helper", "domain": "internal_tools",
+             "autonomy_level": "advisory_only"},
+            {"system_name": "Citizen Score", "domain": "social_scoring",
+             "uses_personal_data": True, "uses_biometric_data": True,
+             "autonomy_level": "fully_autonomous",
+             "affected_population_size": "public"},
+        ]
+        batch = self.assessor.assess_batch(records)
+        assert len(batch) == len(records)
+        for record, result in zip(records, batch):
+            scalar = self.assessor.assess(**record)
+            assert result["system_name"] == record["system_name"]
+            assert result["risk_score"] == round(scalar.risk_score, 1)
+            assert result["risk_level"] == scalar.risk_level.value
+            assert result["eu_ai_act_category"] == scalar.eu_ai_act_category
+
+    def test_assess_batch_empty(self):
+        assert self.assessor.assess_batch([]) == []
+
     def test_biometric_data_increases_risk(self):
         result_no_bio = self.assessor.assess(
             system_name="System A",